@@ -17,6 +17,9 @@ USAGE (command-line examples):
       python simple_calculator_and_helpers.py --expr "12/3 + 4*2"
   - Start GUI calculator:
       python simple_calculator_and_helpers.py --gui
+  - Compile an expression once and call it with different inputs:
+      from this file import compile_expression
+      f = compile_expression("a*x + b", ("a", "x", "b")); f(a=1, x=2, b=3)
   - Create GitHub repo (template; needs GITHUB_TOKEN):
       from this file import create_github_repo
       create_github_repo(token="ghp_xxx", name="my-repo", description="desc", private=False)
@@ -26,11 +29,16 @@ USAGE (command-line examples):
 """
 
 import argparse
+import ast
+import functools
+import keyword
 import math
 import operator
+import re
 import sys
 import json
 import subprocess
+import types
 from pathlib import Path
 
 # Optional imports for network or GUI features
@@ -40,10 +48,12 @@ except Exception:
     requests = None  # helpers will check and raise if called
 
 try:
-    import tkinter as tk
-    from tkinter import ttk, messagebox
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
 except Exception:
-    tk = None  # GUI won't be available
+    MultipartEncoder = None  # uploads fall back to requests' in-memory multipart
+
+# tkinter is imported on first GUI use (see _load_tkinter) so CLI/--expr startup skips loading Tk
+tk = ttk = messagebox = None
 
 # ---------------------------
 # Calculator core (safe eval)
@@ -63,6 +73,12 @@ _ALLOWED_NAMES.update(
         "pow": pow,
     }
 )
+# Freeze the mapping so eval sees a read-only namespace
+_ALLOWED_NAMES = types.MappingProxyType(_ALLOWED_NAMES)
+# Globals passed to eval; built once and shared by every call
+_EVAL_GLOBALS = {"__builtins__": {}}
+# Globals for functions built by compile_expression (function bodies look names up in globals)
+_FUNC_GLOBALS = {"__builtins__": {}, **_ALLOWED_NAMES}
 
 # Supported operators map (for postfix/simple calc usage if desired)
 _OPERATORS = {
@@ -76,29 +92,159 @@ _OPERATORS = {
 }
 
 
+class ExpressionError(ValueError):
+    """
+    Raised for expressions that fail to parse, validate or evaluate.
+    The "Invalid expression: ..." message is only formatted when displayed.
+    """
+
+    def __str__(self):
+        if not self.args:
+            return "Invalid expression"
+        # some causes (e.g. MemoryError) carry no message; name the error instead
+        cause = self.args[0]
+        return f"Invalid expression: {str(cause) or type(cause).__name__}"
+
+
+# Tokens rejected before parsing (one case-insensitive regex pass, no lowered copy)
+_FORBIDDEN_RE = re.compile(r"__|import|os\.|sys\.|subprocess|open\(|eval\(|exec\(", re.IGNORECASE)
+
+# Plain numeric literals (group 1 is set for integers), answered without eval.
+# Integers follow Python's literal rules: no leading zeros.
+_NUMBER_RE = re.compile(
+    r"([+-]?(?:0|[1-9]\d*))|[+-]?(?:(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?|\d+[eE][+-]?\d+)", re.ASCII
+)
+
+
+def _validate_ast(tree, params=()):
+    """
+    Walk a parsed expression and reject attribute access, assignment
+    expressions and unknown names. Names listed in params are accepted as well.
+    Raises ValueError on the first offending node.
+    """
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute):
+            raise ValueError("attribute access is not allowed")
+        if isinstance(node, ast.NamedExpr):
+            # inside a comprehension := writes into the shared _EVAL_GLOBALS, and
+            # results are cached per expression string, so evaluation must not bind names
+            raise ValueError("assignment expressions are not allowed")
+        if isinstance(node, ast.Name) and node.id not in _ALLOWED_NAMES and node.id not in params:
+            raise ValueError(f"name '{node.id}' is not defined")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_expr(expr: str):
+    """
+    Parse, validate and compile an expression string to a code object once;
+    repeats are a cache lookup. Raises SyntaxError or ValueError.
+    """
+    tree = ast.parse(expr, "<expr>", "eval")
+    _validate_ast(tree)
+    return compile(tree, "<expr>", "eval")
+
+
+# Returned by _eval_cached for results that must not be shared through the cache
+_UNCACHED = object()
+
+
+@functools.lru_cache(maxsize=512)
+def _eval_cached(expr: str):
+    """
+    Compile and evaluate an expression, memoizing the result by expression string.
+    This is sound because every name in _ALLOWED_NAMES is a pure function or a
+    constant and the expression carries its own arguments as literals; do not put
+    mutable state into _EVAL_GLOBALS or _ALLOWED_NAMES. _validate_ast rejects
+    assignment expressions so evaluation cannot bind names there either.
+    Only immutable scalars (int, float, complex, bool) are stored; for any other
+    result (e.g. "[1, 2]") _UNCACHED is returned and the caller evaluates afresh.
+    """
+    result = eval(_compile_expr(expr), _EVAL_GLOBALS, _ALLOWED_NAMES)
+    return result if isinstance(result, (int, float, complex)) else _UNCACHED
+
+
 def safe_eval(expr: str):
     """
     Evaluate a numeric expression safely using Python's eval but restricted globals.
     Supports math.* functions and a handful of builtins defined above.
-    Raises ValueError for unsafe expressions or other errors.
+    Numeric results are cached per expression string, so repeated inputs are a lookup.
+    Raises ValueError for unsafe expressions and ExpressionError (a ValueError)
+    for invalid ones; ZeroDivisionError and OverflowError propagate unchanged.
     """
     if not isinstance(expr, str):
         raise ValueError("Expression must be a string.")
+    # eval() used to strip leading whitespace; ast.parse does not
+    expr = expr.strip()
+    # fast path: a bare number needs no parsing, validation or eval
+    m = _NUMBER_RE.fullmatch(expr)
     # simple sanitation: disallow __ and import statements
-    forbidden = ["__", "import", "os.", "sys.", "subprocess", "open(", "eval(", "exec("]
-    lower_expr = expr.lower()
-    for token in forbidden:
-        if token in lower_expr:
-            raise ValueError("Unsafe token detected in expression.")
+    if not m and _FORBIDDEN_RE.search(expr):
+        raise ValueError("Unsafe token detected in expression.")
     try:
-        result = eval(expr, {"__builtins__": {}}, _ALLOWED_NAMES)
-    except ZeroDivisionError:
+        if m:
+            return int(m.group(1)) if m.group(1) else float(expr)
+        result = _eval_cached(expr)
+        if result is _UNCACHED:
+            result = eval(_compile_expr(expr), _EVAL_GLOBALS, _ALLOWED_NAMES)
+    except (ZeroDivisionError, OverflowError):
         raise
-    except Exception as e:
-        raise ValueError(f"Invalid expression: {e}")
+    except (SyntaxError, ValueError, NameError, TypeError, LookupError, RecursionError, MemoryError) as e:
+        # RecursionError/MemoryError: the parser's nesting limits on huge inputs
+        raise ExpressionError(e)
     return result
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_function(expr: str, params: tuple):
+    """
+    Build and compile `lambda <params>: <expr>` from the validated AST.
+    Raises SyntaxError or ValueError.
+    """
+    for name in params:
+        if not isinstance(name, str) or not name.isidentifier() or keyword.iskeyword(name) or "__" in name:
+            raise ValueError(f"invalid parameter name: {name!r}")
+    tree = ast.parse(expr, "<expr>", "eval")
+    _validate_ast(tree, params)
+    args = ast.arguments(
+        posonlyargs=[],
+        args=[ast.arg(arg=name) for name in params],
+        vararg=None,
+        kwonlyargs=[],
+        kw_defaults=[],
+        kwarg=None,
+        defaults=[],
+    )
+    func = ast.Expression(body=ast.Lambda(args=args, body=tree.body))
+    code = compile(ast.fix_missing_locations(func), "<expr>", "eval")
+    return eval(code, _FUNC_GLOBALS)
+
+
+def compile_expression(expr: str, params=()):
+    """
+    Compile an expression template once and return a plain Python function.
+    Use this when the same expression is evaluated with many different inputs:
+    each call is just a function call plus the arithmetic.
+
+    Example:
+      f = compile_expression("a*x + b", ("a", "x", "b"))
+      f(a=1, x=2, b=3)  # -> 5
+      f(2, 3, 4)        # -> 10
+
+    The expression is checked like safe_eval, with params allowed as extra names.
+    Functions are cached per (expr, params). Raises ValueError for unsafe or
+    invalid expressions; errors raised while calling the function propagate as-is.
+    """
+    if not isinstance(expr, str):
+        raise ValueError("Expression must be a string.")
+    expr = expr.strip()
+    if _FORBIDDEN_RE.search(expr):
+        raise ValueError("Unsafe token detected in expression.")
+    try:
+        return _compile_function(expr, tuple(params))
+    except (SyntaxError, ValueError, TypeError, RecursionError, MemoryError) as e:
+        raise ExpressionError(e)
+
+
 # ---------------------------
 # CLI interface
 # ---------------------------
@@ -127,19 +273,57 @@ def interactive_cli():
 # Minimal Tkinter Calculator
 # ---------------------------
 
-class SimpleGuiCalculator(tk.Tk if tk else object):
+# Text inserted for function/constant buttons (other labels insert themselves)
+_BUTTON_MAP = {
+    "pi": "pi",
+    "e": "e",
+    "sqrt": "sqrt(",
+    "sin": "sin(",
+    "cos": "cos(",
+    "tan": "tan(",
+    "pow": "pow(",
+}
+
+
+def _load_tkinter():
+    """
+    Import tkinter into the module globals on first use.
+    Returns False if tkinter is not available on this system.
+    """
+    global tk, ttk, messagebox
+    if tk is None:
+        try:
+            import tkinter
+            from tkinter import ttk as _ttk, messagebox as _messagebox
+        except Exception:
+            return False
+        tk, ttk, messagebox = tkinter, _ttk, _messagebox
+    return True
+
+
+class SimpleGuiCalculator:
+    """
+    Calculator window. Wraps a tk.Tk root rather than subclassing it so the
+    instance can use __slots__.
+    """
+
+    __slots__ = ("root", "entry_var", "_handlers")
+
     def __init__(self):
-        if tk is None:
+        if not _load_tkinter():
             raise RuntimeError("tkinter is not available on this system.")
-        super().__init__()
-        self.title("Simple Calculator")
-        self.geometry("320x450")
-        self.resizable(False, False)
+        self.root = tk.Tk()
+        self.root.title("Simple Calculator")
+        self.root.geometry("320x450")
+        self.root.resizable(False, False)
         self._create_widgets()
 
+    def mainloop(self):
+        self.root.mainloop()
+
     def _create_widgets(self):
-        self.entry_var = tk.StringVar()
-        entry = ttk.Entry(self, textvariable=self.entry_var, font=("Segoe UI", 18), justify="right")
+        self.entry_var = tk.StringVar(master=self.root)
+        entry = ttk.Entry(self.root, textvariable=self.entry_var, font=("Segoe UI", 18), justify="right")
         entry.pack(fill="x", padx=8, pady=8, ipady=10)
 
         buttons = [
@@ -152,52 +336,76 @@ class SimpleGuiCalculator(tk.Tk if tk else object):
             ("pow", "pi", "e", "="),
         ]
 
+        self._handlers = {label: functools.partial(self._on_button, label) for row in buttons for label in row}
         for row in buttons:
-            frame = ttk.Frame(self)
+            frame = ttk.Frame(self.root)
             frame.pack(fill="x", padx=8, pady=2)
             for label in row:
-                btn = ttk.Button(frame, text=label, command=lambda l=label: self._on_button(l))
+                btn = ttk.Button(frame, text=label, command=self._handlers[label])
                 btn.pack(side="left", expand=True, fill="x", padx=2, pady=2)
 
     def _on_button(self, label):
+        ev = self.entry_var
         if label == "C":
-            self.entry_var.set("")
+            ev.set("")
             return
         if label == "±":
-            cur = self.entry_var.get()
+            cur = ev.get()
             if cur.startswith("-"):
-                self.entry_var.set(cur[1:])
+                ev.set(cur[1:])
             else:
-                self.entry_var.set("-" + cur)
+                ev.set("-" + cur)
             return
         if label == "=":
-            expr = self.entry_var.get()
+            expr = ev.get()
             try:
                 result = safe_eval(expr)
-                self.entry_var.set(str(result))
+                ev.set(str(result))
             except Exception as e:
-                messagebox.showerror("Error", str(e))
+                messagebox.showerror("Error", str(e), parent=self.root)
             return
 
-        mapping = {
-            "pi": "pi",
-            "e": "e",
-            "sqrt": "sqrt(",
-            "sin": "sin(",
-            "cos": "cos(",
-            "tan": "tan(",
-            "pow": "pow(",
-        }
-        to_insert = mapping.get(label, label)
+        to_insert = _BUTTON_MAP.get(label, label)
         # append
-        self.entry_var.set(self.entry_var.get() + to_insert)
+        ev.set(ev.get() + to_insert)
+
+
+# ---------------------------
+# Shared HTTP session
+# ---------------------------
+
+# Shared sessions keyed by connection-pool size
+_sessions = {}
+
+
+def _get_session(pool_size: int = 16):
+    """
+    Return a module-wide requests.Session so repeated helper calls reuse
+    pooled keep-alive connections instead of a new TCP+TLS handshake each time.
+    The pool holds pool_size connections so bursts of calls don't evict live ones.
+    Only connection failures are retried (with backoff): nothing has been sent at
+    that point, whereas re-sending a POST after a response or read error could
+    create a repo twice or replay an already-consumed upload stream.
+    """
+    session = _sessions.get(pool_size)
+    if session is None:
+        retry = requests.adapters.Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _sessions[pool_size] = session
+    return session
 
 
 # ---------------------------
 # GitHub helper (template)
 # ---------------------------
 
-def create_github_repo(token: str, name: str, description: str = "", private: bool = False):
+def create_github_repo(token: str, name: str, description: str = "", private: bool = False, session=None,
+                       pool_size: int = 16):
     """
     Create a GitHub repository under the authenticated user using the REST API.
     This is a template function: you must pass a valid GitHub personal access token.
@@ -205,6 +413,9 @@ def create_github_repo(token: str, name: str, description: str = "", private: bo
     Example:
       create_github_repo(token="ghp_xxx", name="my-repo", description="demo", private=False)
 
+    Pass session= to use your own requests.Session; otherwise a shared one with
+    pool_size pooled connections is reused.
+
     Returns dict (API response) on success.
 
     WARNING: Storing tokens in code is insecure. Use environment variables in production.
@@ -222,7 +433,7 @@ def create_github_repo(token: str, name: str, description: str = "", private: bo
         "private": bool(private),
         "auto_init": False,
     }
-    resp = requests.post(url, headers=headers, json=payload, timeout=15)
+    resp = (session or _get_session(pool_size)).post(url, headers=headers, json=payload, timeout=15)
     if resp.status_code not in (200, 201):
         raise RuntimeError(f"GitHub API error {resp.status_code}: {resp.text}")
     return resp.json()
@@ -233,18 +444,31 @@ def init_and_push_local_repo(local_dir: str, repo_url: str, commit_message: str
     Initialize a local git repo, add all files, commit, and push to remote.
     Requires git installed and configured with remote authentication (SSH or stored credentials).
 
+    Re-running after further edits skips 'git init' when .git already exists and
+    points an existing 'origin' remote at repo_url instead of re-adding it. With no
+    new changes, 'git commit' still fails (nothing to commit) and CalledProcessError
+    is raised.
+
     local_dir: path to local directory
     repo_url: remote URL (e.g., git@github.com:user/repo.git or https://github.com/user/repo.git)
     """
     local_path = Path(local_dir).resolve()
     if not local_path.exists():
         raise FileNotFoundError(f"Local path not found: {local_path}")
-    cmds = [
-        ["git", "init"],
+    cmds = []
+    has_origin = False
+    if (local_path / ".git").is_dir():
+        # a freshly initialised repo has no remotes, so only check existing ones
+        has_origin = subprocess.run(
+            ["git", "remote", "get-url", "origin"], cwd=str(local_path), capture_output=True
+        ).returncode == 0
+    else:
+        cmds.append(["git", "init"])
+    cmds += [
         ["git", "add", "--all"],
         ["git", "commit", "-m", commit_message],
         ["git", "branch", "-M", "main"],
-        ["git", "remote", "add", "origin", repo_url],
+        ["git", "remote", "set-url" if has_origin else "add", "origin", repo_url],
         ["git", "push", "-u", "origin", "main"],
     ]
     for cmd in cmds:
@@ -255,7 +479,24 @@ def init_and_push_local_repo(local_dir: str, repo_url: str, commit_message: str
 # Generic upload helper (template for share.stream.io)
 # ---------------------------
 
-def upload_file_to_stream(stream_endpoint: str, file_path: str, api_key: str = None, extra_payload: dict = None):
+def _form_fields(data: dict):
+    """
+    Flatten form data into (name, value) pairs the way requests does for data=:
+    None values are skipped, lists/tuples become repeated fields, and
+    non-bytes values are converted with str().
+    """
+    fields = []
+    for name, values in data.items():
+        if isinstance(values, (str, bytes)) or not hasattr(values, "__iter__"):
+            values = [values]
+        for v in values:
+            if v is not None:
+                fields.append((name, v if isinstance(v, bytes) else str(v)))
+    return fields
+
+
+def upload_file_to_stream(stream_endpoint: str, file_path: str, api_key: str = None, extra_payload: dict = None,
+                          session=None, pool_size: int = 16):
     """
     Upload a file to a generic stream-like endpoint (template).
     For share.stream.io you must adapt to their exact API (this is a generic pattern).
@@ -265,10 +506,14 @@ def upload_file_to_stream(stream_endpoint: str, file_path: str, api_key: str = N
       - file_path: path to the file to upload.
       - api_key: optional API key to include in headers.
       - extra_payload: dict with additional form fields.
+      - session: optional requests.Session; defaults to a shared, pooled session.
+      - pool_size: connection-pool size of the shared session (ignored with session=).
 
     Returns:
       - Response JSON (if response contains JSON), or raw text.
 
+    If 'requests-toolbelt' is installed the file is streamed rather than read into memory.
+
     WARNING: This function uses 'requests'. Provide valid endpoint & credentials.
     """
     if requests is None:
@@ -279,21 +524,55 @@ def upload_file_to_stream(stream_endpoint: str, file_path: str, api_key: str = N
     headers = {}
     if api_key:
         headers["Authorization"] = f"Bearer {api_key}"
-    files = {"file": (p.name, p.open("rb"))}
     data = extra_payload or {}
-    resp = requests.post(stream_endpoint, headers=headers, files=files, data=data, timeout=30)
-    # close file
-    files["file"][1].close()
-    try:
-        return resp.json()
-    except Exception:
-        return resp.text
+    session = session or _get_session(pool_size)
+    with p.open("rb") as fh:
+        if MultipartEncoder is not None:
+            # stream the body in chunks instead of building it in memory
+            fields = _form_fields(data)
+            fields.append(("file", (p.name, fh, "application/octet-stream")))
+            m = MultipartEncoder(fields=fields)
+            headers["Content-Type"] = m.content_type
+            resp = session.post(stream_endpoint, headers=headers, data=m, timeout=30)
+        else:
+            resp = session.post(stream_endpoint, headers=headers, files={"file": (p.name, fh)}, data=data, timeout=30)
+    # only attempt a JSON parse when the server says the body is JSON
+    if "json" in resp.headers.get("Content-Type", ""):
+        try:
+            return resp.json()
+        except ValueError:
+            pass
+    return resp.text
 
 
 # ---------------------------
 # Main CLI argument parsing
 # ---------------------------
 
+_DEMOS = (
+    "2+2",
+    "sqrt(16)",
+    "sin(pi/2) + cos(0)",
+    "pow(2, 8)",
+    "10 % 3",
+    "log(100, 10)",  # math.log with base
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _demo_results():
+    """
+    Evaluate the demo expressions once, on first use; failing ones are skipped.
+    """
+    results = []
+    for d in _DEMOS:
+        try:
+            results.append((d, safe_eval(d)))
+        except Exception:
+            pass
+    return tuple(results)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Simple calculator + GitHub/upload helper (single .py file).")
     group = parser.add_mutually_exclusive_group()
@@ -307,7 +586,7 @@ def main():
         return
 
     if args.gui:
-        if tk is None:
+        if not _load_tkinter():
             print("Tkinter not available on this system. Install tkinter or run with --cli or --expr.")
             return
         app = SimpleGuiCalculator()
@@ -325,19 +604,8 @@ def main():
     # If no args: show usage and a tiny demo
     parser.print_help()
     print("\nDemo expressions you can try:")
-    demos = [
-        "2+2",
-        "sqrt(16)",
-        "sin(pi/2) + cos(0)",
-        "pow(2, 8)",
-        "10 % 3",
-        "log(100, 10)"  # math.log with base
-    ]
-    for d in demos:
-        try:
-            print(f"{d}  ->  {safe_eval(d)}")
-        except Exception:
-            pass
+    for d, result in _demo_results():
+        print(f"{d}  ->  {result}")
 
 
 if __name__ == "__main__":